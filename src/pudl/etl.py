@@ -284,14 +284,13 @@ def etl_epacems(
     if logger.isEnabledFor(logging.INFO):
         start_time = time.monotonic()
 
-    # run the cems generator dfs through the load step
-    for df in epacems_transformed_dfs:
-        pudl.load.df_to_parquet(
-            df,
-            resource_id="hourly_emissions_epacems",
-            root_path=Path(pudl_settings["parquet_dir"]) / "epacems",
-            partition_cols=["year", "state"],
-        )
+    # run the cems generator dfs through the load step, one month at a time
+    pudl.load.dfs_to_parquet(
+        epacems_transformed_dfs,
+        resource_id="hourly_emissions_epacems",
+        root_path=Path(pudl_settings["parquet_dir"]) / "epacems",
+        partition_cols=["year", "state"],
+    )
 
     if logger.isEnabledFor(logging.INFO):
         delta_t = time.strftime("%H:%M:%S", time.gmtime(time.monotonic() - start_time))
@@ -3,13 +3,21 @@ Retrieve data from EPA CEMS hourly zipped CSVs.
 
 This modules pulls data from EPA's published CSV files.
 """
+import collections
+import csv
+import functools
+import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import NamedTuple
+from typing import Iterator, List, NamedTuple
 from zipfile import ZipFile
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 
+from pudl.metadata.classes import Resource
 from pudl.metadata.fields import apply_pudl_dtypes
 from pudl.settings import EpaCemsSettings
 from pudl.workspace.datastore import Datastore
@@ -72,6 +80,30 @@ IGNORE_COLS = {
 }
 """set: The set of EPA CEMS columns to ignore when reading data."""
 
+MONTHS_IN_FLIGHT = 3
+"""int: The number of monthly files in a partition that are parsed concurrently."""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_include_columns(header: bytes) -> List[str]:
+    """List the columns to read from a CSV with the given header line.
+
+    Only a handful of distinct headers exist across all of the EPA CEMS files, so the
+    result is cached rather than re-parsed for each file. A leading UTF-8 byte order
+    mark is dropped, as Arrow strips it from the column names it reads.
+    """
+    return [
+        col
+        for col in next(csv.reader([header.decode("utf-8-sig")]))
+        if col not in IGNORE_COLS
+    ]
+
+
+def _select_columns(table: pa.Table) -> pa.Table:
+    """Put the columns of an extracted table in a consistent order."""
+    columns = dict.fromkeys(RENAME_DICT.values())
+    return table.select([col for col in columns if col in table.column_names])
+
 
 class EpaCemsPartition(NamedTuple):
     """Represents EpaCems partition identifying unique resource file."""
@@ -104,41 +136,119 @@ class EpaCemsDatastore:
     def __init__(self, datastore: Datastore):
         """Constructs a simple datastore wrapper for loading EpaCems dataframes from datastore."""
         self.datastore = datastore
+        fields = {
+            field.name: field
+            for field in Resource.from_id("hourly_emissions_epacems").schema.fields
+            if field.name in RENAME_DICT.values()
+        }
+        # Pandas dtypes to coerce the extracted columns to, keyed by PUDL names.
+        # Enumerated columns like the measurement codes are categorical, and numeric
+        # columns use 32-bit types, matching the Parquet schema.
+        self._dtype_map = {
+            name: field.to_pandas_dtype(compact=True) for name, field in fields.items()
+        }
+        # Arrow types for the raw CSV columns, keyed by their original names. The
+        # CSV reader only dictionary encodes with int32 indices.
+        self._column_types = {
+            col: (
+                pa.dictionary(pa.int32(), pa.string())
+                if fields[new_col].constraints.enum
+                else fields[new_col].to_pyarrow_dtype()
+            )
+            for col, new_col in RENAME_DICT.items()
+            if new_col in fields
+        }
 
     def get_data_frame(self, partition: EpaCemsPartition) -> pd.DataFrame:
         """Constructs dataframe holding data for a given (year, state) partition."""
-        archive = self.datastore.get_zipfile_resource(
+        # Columns only present in some months (e.g. facility_id) are null-filled.
+        table = pa.concat_tables(list(self.iter_month_tables(partition)), promote=True)
+        return self.table_to_data_frame(_select_columns(table))
+
+    def iter_month_tables(self, partition: EpaCemsPartition) -> Iterator[pa.Table]:
+        """Yield one table per month of a given (year, state) partition, in order.
+
+        At most :py:const:`MONTHS_IN_FLIGHT` months are parsed ahead of the one being
+        yielded, and each month's data is released once it has been handed over, so
+        callers that consume the tables one at a time never hold a whole partition's
+        parsed data in memory.
+        """
+        # Read all the monthly zips out of the archive sequentially up front, so the
+        # archive isn't accessed from several threads while they parse, and can be
+        # closed before any parsing happens.
+        with self.datastore.get_zipfile_resource(
             "epacems", **partition.get_filters()
+        ) as archive:
+            monthly_zips = {
+                month: archive.read(
+                    str(partition.get_monthly_file(month).with_suffix(".zip"))
+                )
+                for month in range(1, 13)
+            }
+        # Parsing releases the GIL, so a few months are parsed concurrently.
+        with ThreadPoolExecutor(max_workers=MONTHS_IN_FLIGHT) as executor:
+            futures = collections.deque()
+            for month in range(1, 13):
+                futures.append(
+                    executor.submit(
+                        self._parse_month, monthly_zips.pop(month), partition, month
+                    )
+                )
+                if len(futures) == MONTHS_IN_FLIGHT:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+
+    def table_to_data_frame(self, table: pa.Table) -> pd.DataFrame:
+        """Convert a table of extracted EPA CEMS data to a typed dataframe.
+
+        The table's memory is released as it is converted, so it can't be used again.
+        """
+        return apply_pudl_dtypes(
+            table.to_pandas(split_blocks=True, self_destruct=True),
+            dtypes=self._dtype_map,
+            copy=False,
         )
-        dfs = []
-        for month in range(1, 13):
-            mf = partition.get_monthly_file(month)
-            with archive.open(str(mf.with_suffix(".zip")), "r") as mzip:
-                with ZipFile(mzip, "r").open(
-                    str(mf.with_suffix(".csv")), "r"
-                ) as csv_file:
-                    dfs.append(self._csv_to_dataframe(csv_file))
-        return pd.concat(dfs, sort=True, copy=False, ignore_index=True)
-
-    def _csv_to_dataframe(self, csv_file) -> pd.DataFrame:
+
+    def _parse_month(
+        self, zip_bytes: bytes, partition: EpaCemsPartition, month: int
+    ) -> pa.Table:
+        """Extract and parse the CSV for one month of a partition from its zip."""
+        mf = partition.get_monthly_file(month)
+        with ZipFile(io.BytesIO(zip_bytes)) as mzip:
+            csv_bytes = mzip.read(str(mf.with_suffix(".csv")))
+        return self._csv_to_table(io.BytesIO(csv_bytes))
+
+    def _csv_to_table(self, csv_file) -> pa.Table:
         """
-        Convert a CEMS csv file into a :class:`pandas.DataFrame`.
+        Convert a CEMS csv file into a :class:`pyarrow.Table`.
+
+        The CSV is parsed with PyArrow's multithreaded reader. The header is read
+        first so that the ignored columns can be excluded from parsing entirely.
 
         Args:
-            csv (file-like object): data to be read
+            csv_file (file-like object): seekable binary data to be read
 
         Returns:
-            A DataFrame containing the contents of the CSV file.
+            A Table containing the contents of the CSV file, with PUDL column names
+            in a consistent order.
 
         """
-        return (
-            pd.read_csv(
-                csv_file,
-                index_col=False,
-                usecols=lambda col: col not in IGNORE_COLS,
+        include_columns = _get_include_columns(csv_file.readline())
+        csv_file.seek(0)
+        table = pv.read_csv(
+            csv_file,
+            read_options=pv.ReadOptions(block_size=8 << 20),
+            convert_options=pv.ConvertOptions(
+                include_columns=include_columns,
+                column_types=self._column_types,
+                strings_can_be_null=True,
+            ),
+        )
+        return _select_columns(
+            table.rename_columns(
+                [RENAME_DICT.get(col, col) for col in table.column_names]
             )
-            .rename(columns=RENAME_DICT)
-            .pipe(apply_pudl_dtypes, group="epacems")
         )
 
 
@@ -153,7 +263,8 @@ def extract(epacems_settings: EpaCemsSettings, ds: Datastore):
         ds (:class:`Datastore`): Initialized datastore
 
     Yields:
-        pandas.DataFrame: A single state-year of EPA CEMS hourly emissions data.
+        pandas.DataFrame: A single state-year-month of EPA CEMS hourly emissions data.
+        Months are yielded in order, one state-year at a time.
 
     """
     ds = EpaCemsDatastore(ds)
@@ -161,6 +272,6 @@ def extract(epacems_settings: EpaCemsSettings, ds: Datastore):
         for state in epacems_settings.states:
             partition = EpaCemsPartition(state=state, year=year)
             logger.info(f"Processing EPA CEMS hourly data for {state}-{year}")
-            # We have to assign the reporting year for partitioning purposes
-            df = ds.get_data_frame(partition).assign(year=year)
-            yield df
+            for table in ds.iter_month_tables(partition):
+                # We have to assign the reporting year for partitioning purposes
+                yield ds.table_to_data_frame(table).assign(year=year)
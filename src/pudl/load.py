@@ -5,7 +5,7 @@ import sys
 from pathlib import Path
 from sqlite3 import Connection as SQLite3Connection
 from sqlite3 import sqlite_version
-from typing import Dict, List, Literal, Union
+from typing import Dict, Iterable, Iterator, List, Literal, Tuple, Union
 
 import pandas as pd
 import pyarrow as pa
@@ -118,3 +118,94 @@ def df_to_parquet(
         partition_cols=partition_cols,
         compression="snappy",
     )
+
+
+def _iter_partitions(
+    dfs: Iterable[pd.DataFrame], partition_cols: List[str]
+) -> Iterator[Tuple[Tuple, pd.DataFrame]]:
+    """Split each dataframe by partition, yielding the partition key and its rows."""
+    for df in dfs:
+        for key, part_df in df.groupby(partition_cols, sort=False, observed=True):
+            yield key if isinstance(key, tuple) else (key,), part_df
+
+
+def _partition_path(
+    root_path: Union[str, Path], partition_cols: List[str], key: Tuple
+) -> Path:
+    """Create the hive-style directory for a partition and return its file path."""
+    part_dir = Path(root_path).joinpath(
+        *(f"{col}={val}" for col, val in zip(partition_cols, key))
+    )
+    part_dir.mkdir(parents=True, exist_ok=True)
+    return part_dir / f"{'-'.join(str(val) for val in key)}.parquet"
+
+
+def dfs_to_parquet(
+    dfs: Iterable[pd.DataFrame],
+    resource_id: str,
+    root_path: Union[str, Path],
+    partition_cols: List[str],
+) -> None:
+    """
+    Stream a sequence of PUDL dataframes into a partitioned Parquet dataset.
+
+    Unlike :func:`df_to_parquet`, each dataframe is written out as a row group as soon
+    as it arrives, so a whole partition never needs to be held in memory. All the
+    data for a given partition is written to a single file, so the dataframes must
+    arrive grouped by partition. A partition that reappears after another one has
+    started is an error, rather than silently truncating the partition's file. The
+    output uses the same directory layout as :func:`pyarrow.parquet.write_to_dataset`.
+
+    If an error occurs, the file for the partition that was being written is
+    removed, so only complete partitions are left behind.
+
+    Args:
+        dfs: The tabular data to be written to a Parquet dataset.
+        resource_id: Name of the table that's being written to Parquet.
+        root_path: Top level directory for the partitioned dataset.
+        partition_cols: Columns to use to partition the Parquet dataset. For
+            EPA CEMS we use ["year", "state"].
+
+    Raises:
+        ValueError: if the dataframes aren't grouped by partition.
+
+    """
+    schema = Resource.from_id(resource_id).to_pyarrow()
+    for col in partition_cols:
+        schema = schema.remove(schema.get_field_index(col))
+
+    writer = None
+    current_key = None
+    current_path = None
+    finished_keys = set()
+    try:
+        for key, part_df in _iter_partitions(dfs, partition_cols):
+            if key != current_key:
+                if key in finished_keys:
+                    raise ValueError(
+                        f"Partition {dict(zip(partition_cols, key))} of "
+                        f"{resource_id} was already written. The dataframes "
+                        "must arrive grouped by partition."
+                    )
+                if writer is not None:
+                    writer.close()
+                    finished_keys.add(current_key)
+                current_path = _partition_path(root_path, partition_cols, key)
+                writer = pq.ParquetWriter(current_path, schema, compression="snappy")
+                current_key = key
+            writer.write_table(
+                pa.Table.from_pandas(
+                    part_df.drop(columns=partition_cols),
+                    schema=schema,
+                    preserve_index=False,
+                )
+            )
+    except BaseException:
+        # Don't leave a valid looking file behind holding only part of a partition.
+        if writer is not None:
+            writer.close()
+            current_path.unlink()
+        raise
+    else:
+        if writer is not None:
+            writer.close()
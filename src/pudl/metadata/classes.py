@@ -171,6 +171,8 @@ class Base(pydantic.BaseModel):
         validate_assignment: bool = True
         extra: str = "forbid"
         arbitrary_types_allowed = True
+        # Nested models have already been validated, so don't copy them again.
+        copy_on_model_validation: str = "none"
 
     def dict(self, *args, by_alias=True, **kwargs) -> dict:  # noqa: A003
         """Return as a dictionary."""
@@ -2137,6 +2137,8 @@ def apply_pudl_dtypes(
     group: Optional[str] = None,
     field_meta: Optional[Dict[str, Any]] = FIELD_METADATA,
     field_meta_by_group: Optional[Dict[str, Any]] = FIELD_METADATA_BY_GROUP,
+    dtypes: Optional[Dict[str, Any]] = None,
+    copy: bool = True,
 ) -> pd.DataFrame:
     """
     Apply dtypes to those columns in a dataframe that have PUDL types defined.
@@ -2145,6 +2147,9 @@ def apply_pudl_dtypes(
     metadata before it's passed in as `field_meta` if you have module specific column
     types you need to apply alongside the standard PUDL field types.
 
+    Columns which already have the right dtype are not cast. Casting to a
+    categorical dtype raises a ValueError if it would turn any values into NA.
+
     Args:
         df: The dataframe to apply types to. Not all columns need to have types
             defined in the PUDL metadata.
@@ -2155,16 +2160,48 @@ def apply_pudl_dtypes(
         field_meta_by_group: A dictionary of field metadata to use as overrides,
             based on the value of `group`, if any. By default it uses the overrides
             defined in pudl.metadata.fields.FIELD_METADATA_BY_GROUP.
+        dtypes: A precomputed mapping of column names to dtypes, e.g. from
+            :meth:`pudl.metadata.classes.Resource.to_pandas_dtypes`. If given,
+            `group`, `field_meta` and `field_meta_by_group` are ignored. Useful
+            when the same types are applied to many dataframes.
+        copy: Whether to copy the data. If False, the returned dataframe may share
+            memory with the input.
 
     Returns:
         The input dataframe, but with standard PUDL types applied.
 
     """
-    dtypes = get_pudl_dtypes(
-        group=group,
-        field_meta=field_meta,
-        field_meta_by_group=field_meta_by_group,
-        dtype_map=FIELD_DTYPES_PANDAS,
-    )
+    if dtypes is None:
+        dtypes = get_pudl_dtypes(
+            group=group,
+            field_meta=field_meta,
+            field_meta_by_group=field_meta_by_group,
+            dtype_map=FIELD_DTYPES_PANDAS,
+        )
+    to_cast = {}
+    for col in df.columns:
+        if col in dtypes:
+            dtype = pd.api.types.pandas_dtype(dtypes[col])
+            if dtype != df[col].dtype:
+                to_cast[col] = dtype
+                if isinstance(dtype, pd.CategoricalDtype):
+                    _check_categories(df[col], dtype)
+
+    return df.astype(to_cast, copy=copy)
+
 
-    return df.astype({col: dtypes[col] for col in df.columns if col in dtypes})
+def _check_categories(col: pd.Series, dtype: pd.CategoricalDtype) -> None:
+    """Make sure casting a column to a categorical dtype won't drop any values.
+
+    Values which aren't among the categories would silently become NA.
+
+    Raises:
+        ValueError: if the column contains values which aren't categories.
+    """
+    unknown = col[col.notna() & ~col.isin(dtype.categories)]
+    if not unknown.empty:
+        counts = unknown.astype(object).value_counts().to_dict()
+        raise ValueError(
+            f"Column {col.name} contains values which are not among its allowed "
+            f"categories, and would be lost (value: count): {counts}"
+        )
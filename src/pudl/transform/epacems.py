@@ -8,6 +8,7 @@ import pandas as pd
 import pytz
 import sqlalchemy as sa
 
+from pudl.metadata.classes import Resource
 from pudl.metadata.fields import apply_pudl_dtypes
 
 logger = logging.getLogger(__name__)
@@ -205,17 +206,20 @@ def transform(epacems_raw_dfs, pudl_engine):
 
     Args:
         epacems_raw_dfs: a :class:`pandas.Dataframe` generator that yields raw
-            epacems data, one state-year at a time.
+            epacems data, one state-year-month at a time.
         pudl_engine: a :class:`sqlalchemy.engine.Engine` for connecting to an
             existing PUDL DB.
 
     Yields:
-        pandas.Dataframe: A single year-state of EPA CEMS data,
+        pandas.Dataframe: A single year-state-month of EPA CEMS data,
 
     """
     # epacems_raw_dfs is a generator. Pull out one dataframe, run it through
     # a transformation pipeline, and yield it back as another generator.
     plant_utc_offset = _load_plant_utc_offset(pudl_engine)
+    # Enumerated columns like the measurement codes are kept categorical, and the
+    # numeric columns use the same 32-bit types as the Parquet schema.
+    dtypes = Resource.from_id("hourly_emissions_epacems").to_pandas_dtypes(compact=True)
     for raw_df in epacems_raw_dfs:
         transformed_df = (
             raw_df.fillna({"gross_load_mw": 0.0, "heat_content_mmbtu": 0.0})
@@ -223,6 +227,6 @@ def transform(epacems_raw_dfs, pudl_engine):
             .pipe(fix_up_dates, plant_utc_offset=plant_utc_offset)
             .pipe(add_facility_id_unit_id_epa)
             .pipe(correct_gross_load_mw)
-            .pipe(apply_pudl_dtypes, group="epacems")
+            .pipe(apply_pudl_dtypes, dtypes=dtypes, copy=False)
         )
         yield transformed_df
@@ -2,6 +2,7 @@
 import logging
 import os
 from pathlib import Path
+from typing import Dict
 
 import pytest
 import sqlalchemy as sa
@@ -13,6 +14,25 @@ from pudl.settings import EtlSettings
 
 logger = logging.getLogger(__name__)
 
+_engine_cache: Dict[str, sa.engine.Engine] = {}
+
+
+def _get_engine(dsn: str) -> sa.engine.Engine:
+    """Create a SQLAlchemy engine for the given DSN, reusing it if one exists."""
+    if dsn not in _engine_cache:
+        kwargs = {}
+        if dsn.startswith("sqlite"):
+            # Intentionally share a single connection to the file-backed SQLite DB
+            # rather than re-opening the file for each checkout. Every user of the
+            # engine sees the same DBAPI connection, so nested connections and
+            # transactions share state; the tests only read from these DBs.
+            kwargs = dict(
+                poolclass=sa.pool.StaticPool,
+                connect_args={"check_same_thread": False},
+            )
+        _engine_cache[dsn] = sa.create_engine(dsn, **kwargs)
+    return _engine_cache[dsn]
+
 
 def pytest_addoption(parser):
     """Add a command line option Requiring fresh data download."""
@@ -47,6 +67,15 @@ def pytest_addoption(parser):
     )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def dispose_engines():
+    """Dispose of the SQLAlchemy engines created during the test session."""
+    yield
+    for engine in _engine_cache.values():
+        engine.dispose()
+    _engine_cache.clear()
+
+
 @pytest.fixture(scope="session", name="test_dir")
 def test_directory():
     """Return the path to the top-level directory containing the tests."""
@@ -140,7 +169,7 @@ def ferc1_sql_engine(
             clobber=False,
             datastore=pudl_datastore_fixture,
         )
-    engine = sa.create_engine(pudl_settings_fixture["ferc1_db"])
+    engine = _get_engine(pudl_settings_fixture["ferc1_db"])
     logger.info("FERC1 Engine: %s", engine)
     return engine
 
@@ -172,7 +201,7 @@ def pudl_sql_engine(
     # Grab a connection to the freshly populated PUDL DB, and hand it off.
     # All the hard work here is being done by the datapkg and
     # datapkg_to_sqlite fixtures, above.
-    engine = sa.create_engine(pudl_settings_fixture["pudl_db"])
+    engine = _get_engine(pudl_settings_fixture["pudl_db"])
     logger.info("PUDL Engine: %s", engine)
     return engine
 
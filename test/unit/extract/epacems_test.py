@@ -0,0 +1,177 @@
+"""Unit tests for the pudl.extract.epacems module."""
+import io
+from zipfile import ZipFile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pudl.extract.epacems import MONTHS_IN_FLIGHT, EpaCemsDatastore, EpaCemsPartition
+
+CSV_LONG_HEADERS = b"""STATE,FACILITY_NAME,ORISPL_CODE,UNITID,OP_DATE,OP_HOUR,OP_TIME,GLOAD (MW),SO2_MASS (lbs),SO2_MASS_MEASURE_FLG,SO2_RATE (lbs/mmBtu),HEAT_INPUT (mmBtu)
+CO,Plant A,3,01,01-01-2020,0,1.00,150,12.5,Measured,0.1,1000.5
+CO,Plant A,3,01,01-01-2020,1,1.00,,,,,
+"""
+
+CSV_SHORT_HEADERS = b"""STATE,FACILITY_NAME,ORISPL_CODE,UNITID,OP_DATE,OP_HOUR,OP_TIME,GLOAD,SO2_MASS,SO2_MASS_MEASURE_FLG,SO2_RATE,HEAT_INPUT,FAC_ID,UNIT_ID
+CO,Plant A,3,01,01-01-2020,2,1.00,140,11.5,Calculated,0.1,900.0,1,2
+"""
+
+
+def _csv_to_table(csv_bytes: bytes) -> pa.Table:
+    """Parse an in-memory EPA CEMS CSV."""
+    return EpaCemsDatastore(datastore=None)._csv_to_table(io.BytesIO(csv_bytes))
+
+
+def test__csv_to_table__drops_ignored_columns():
+    """Columns in IGNORE_COLS are never read."""
+    for csv_bytes in (CSV_LONG_HEADERS, CSV_SHORT_HEADERS):
+        columns = _csv_to_table(csv_bytes).column_names
+        assert "FACILITY_NAME" not in columns
+        assert not [col for col in columns if col.startswith("SO2_RATE")]
+
+
+def test__csv_to_table__renames_both_header_spellings():
+    """Both spellings of the EPA CEMS column headers map to the PUDL names."""
+    expected = [
+        "state",
+        "plant_id_eia",
+        "unitid",
+        "op_date",
+        "op_hour",
+        "operating_time_hours",
+        "gross_load_mw",
+        "so2_mass_lbs",
+        "so2_mass_measurement_code",
+        "heat_content_mmbtu",
+    ]
+    assert _csv_to_table(CSV_LONG_HEADERS).column_names == expected
+    assert _csv_to_table(CSV_SHORT_HEADERS).column_names == expected + [
+        "facility_id",
+        "unit_id_epa",
+    ]
+
+
+def test__csv_to_table__unitid_keeps_leading_zeros():
+    """Unit IDs are read as strings, not inferred as integers."""
+    table = _csv_to_table(CSV_LONG_HEADERS)
+    assert table.schema.field("unitid").type == pa.string()
+    assert table.column("unitid").to_pylist() == ["01", "01"]
+
+
+def test__csv_to_table__empty_cells_are_null():
+    """Empty numeric and string cells are both read as nulls."""
+    table = _csv_to_table(CSV_LONG_HEADERS)
+    for col in [
+        "gross_load_mw",
+        "so2_mass_lbs",
+        "so2_mass_measurement_code",
+        "heat_content_mmbtu",
+    ]:
+        assert table.column(col).to_pylist()[1] is None
+
+
+class FakeDatastore:
+    """Serves an in-memory EPA CEMS archive for a single partition."""
+
+    def __init__(self, partition: EpaCemsPartition):
+        """Build an archive with one zipped CSV per month.
+
+        Months before July use the long headers, later ones the short headers.
+        """
+        outer = io.BytesIO()
+        with ZipFile(outer, "w") as outer_zip:
+            for month in range(1, 13):
+                mf = partition.get_monthly_file(month)
+                inner = io.BytesIO()
+                with ZipFile(inner, "w") as inner_zip:
+                    inner_zip.writestr(
+                        str(mf.with_suffix(".csv")),
+                        CSV_LONG_HEADERS if month < 7 else CSV_SHORT_HEADERS,
+                    )
+                outer_zip.writestr(str(mf.with_suffix(".zip")), inner.getvalue())
+        self.archive = outer.getvalue()
+
+    def get_zipfile_resource(self, dataset, **filters):
+        """Open the fake archive, keeping track of it."""
+        self.opened = ZipFile(io.BytesIO(self.archive))
+        return self.opened
+
+
+class CountingEpaCemsDatastore(EpaCemsDatastore):
+    """Records how many months have been handed to the parser."""
+
+    parsed = 0
+
+    def _parse_month(self, zip_bytes, partition, month):
+        """Count the month and parse it."""
+        self.parsed += 1
+        return super()._parse_month(zip_bytes, partition, month)
+
+
+def test_iter_month_tables__bounded_and_in_order():
+    """Months are yielded in order without parsing the whole partition ahead."""
+    partition = EpaCemsPartition(year=2020, state="CO")
+    ds = CountingEpaCemsDatastore(FakeDatastore(partition))
+    tables = ds.iter_month_tables(partition)
+    first = next(tables)
+    assert ds.parsed <= MONTHS_IN_FLIGHT
+    # The outer archive has been released before the monthly data is consumed.
+    assert ds.datastore.opened.fp is None
+    assert first.num_rows == 2
+    rest = list(tables)
+    assert ds.parsed == 12
+    assert [t.num_rows for t in rest] == [2] * 5 + [1] * 6
+
+
+def test_get_data_frame__promotes_missing_columns():
+    """Columns missing from some months are null-filled when months are combined."""
+    partition = EpaCemsPartition(year=2020, state="CO")
+    df = EpaCemsDatastore(FakeDatastore(partition)).get_data_frame(partition)
+    assert len(df) == 18
+    assert df["facility_id"].isna().sum() == 12
+    assert df["facility_id"].notna().sum() == 6
+
+
+def test_table_to_data_frame__unknown_measurement_code_raises():
+    """Unrecognized codes are reported rather than silently turned into NA."""
+    ds = EpaCemsDatastore(datastore=None)
+    csv_bytes = CSV_LONG_HEADERS.replace(b"Measured", b"Bogus")
+    with pytest.raises(ValueError, match="'Bogus': 1"):
+        ds.table_to_data_frame(ds._csv_to_table(io.BytesIO(csv_bytes)))
+
+
+def test_table_to_data_frame__measurement_codes_are_categorical():
+    """Known measurement codes are kept, as the enumerated categorical dtype."""
+    ds = EpaCemsDatastore(datastore=None)
+    df = ds.table_to_data_frame(ds._csv_to_table(io.BytesIO(CSV_LONG_HEADERS)))
+    codes = df["so2_mass_measurement_code"]
+    assert isinstance(codes.dtype, pd.CategoricalDtype)
+    assert "Measured and Substitute" in codes.cat.categories
+    assert codes.tolist()[0] == "Measured"
+    assert pd.isna(codes.tolist()[1])
+
+
+def test_table_to_data_frame__compact_dtypes():
+    """Extracted numeric columns use the 32-bit PUDL dtypes."""
+    ds = EpaCemsDatastore(datastore=None)
+    df = ds.table_to_data_frame(ds._csv_to_table(io.BytesIO(CSV_SHORT_HEADERS)))
+    expected = {
+        "plant_id_eia": pd.Int32Dtype(),
+        "facility_id": pd.Int32Dtype(),
+        "unitid": pd.StringDtype(),
+        "unit_id_epa": pd.StringDtype(),
+        "operating_time_hours": np.dtype("float32"),
+        "gross_load_mw": np.dtype("float32"),
+        "so2_mass_lbs": np.dtype("float32"),
+        "heat_content_mmbtu": np.dtype("float32"),
+    }
+    assert {col: df[col].dtype for col in expected} == expected
+
+
+def test__csv_to_table__utf8_bom():
+    """A byte order mark doesn't stop the first column from being selected."""
+    table = _csv_to_table(b"\xef\xbb\xbf" + CSV_LONG_HEADERS)
+    assert table.column_names == _csv_to_table(CSV_LONG_HEADERS).column_names
+    assert table.column("state").to_pylist() == ["CO", "CO"]
@@ -0,0 +1,119 @@
+"""Unit tests for the pudl.load module."""
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+
+from pudl.load import dfs_to_parquet
+from pudl.metadata.classes import Resource
+
+RESOURCE_ID = "hourly_emissions_epacems"
+PARTITION_COLS = ["year", "state"]
+
+
+def _epacems_df(state: str, nrows: int) -> pd.DataFrame:
+    """Make a minimal EPA CEMS dataframe for a single partition."""
+    return pd.DataFrame(
+        {
+            "state": state,
+            "plant_id_eia": range(nrows),
+            "unitid": "1",
+            "operating_datetime_utc": pd.date_range(
+                "2020-01-01", periods=nrows, freq="H"
+            ),
+            "operating_time_hours": 1.0,
+            "gross_load_mw": 100.0,
+            "steam_load_1000_lbs": None,
+            "so2_mass_lbs": 1.0,
+            "so2_mass_measurement_code": "Measured",
+            "nox_rate_lbs_mmbtu": 0.1,
+            "nox_rate_measurement_code": "Calculated",
+            "nox_mass_lbs": 1.0,
+            "nox_mass_measurement_code": "Measured",
+            "co2_mass_tons": 1.0,
+            "co2_mass_measurement_code": "Measured",
+            "heat_content_mmbtu": 10.0,
+            "facility_id": 1,
+            "unit_id_epa": "2",
+            "year": 2020,
+        }
+    ).astype(Resource.from_id(RESOURCE_ID).to_pandas_dtypes(compact=True))
+
+
+def test_dfs_to_parquet_partitions(tmp_path):
+    """Streamed dataframes end up in one hive-partitioned file per partition."""
+    dfs = [
+        _epacems_df("CO", 2),
+        pd.concat([_epacems_df("CO", 1), _epacems_df("ID", 3)], ignore_index=True),
+    ]
+    dfs_to_parquet(
+        dfs, resource_id=RESOURCE_ID, root_path=tmp_path, partition_cols=PARTITION_COLS
+    )
+
+    files = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*"))
+    assert [f for f in files if f.endswith(".parquet")] == [
+        "year=2020/state=CO/2020-CO.parquet",
+        "year=2020/state=ID/2020-ID.parquet",
+    ]
+
+    dataset = ds.dataset(tmp_path, format="parquet", partitioning="hive")
+    df = dataset.to_table().to_pandas()
+    assert df.groupby(["year", "state"], observed=True).size().to_dict() == {
+        (2020, "CO"): 3,
+        (2020, "ID"): 3,
+    }
+
+    # Parquet stores second timestamps as milliseconds, and reads dictionaries
+    # back with int32 indices, so only the logical types are compared.
+    expected = Resource.from_id(RESOURCE_ID).to_pyarrow()
+    assert (
+        dataset.schema.names
+        == [name for name in expected.names if name not in PARTITION_COLS]
+        + PARTITION_COLS
+    )
+    for field in expected:
+        if field.name in PARTITION_COLS:
+            continue
+        actual = dataset.schema.field(field.name)
+        assert actual.nullable == field.nullable
+        if pa.types.is_timestamp(field.type):
+            assert actual.type.tz == field.type.tz
+        elif pa.types.is_dictionary(field.type):
+            assert actual.type.value_type == field.type.value_type
+        else:
+            assert actual.type == field.type
+
+
+def test_dfs_to_parquet_rejects_repeated_partition(tmp_path):
+    """A partition reappearing after another one would truncate its file."""
+    dfs = [_epacems_df("CO", 1), _epacems_df("ID", 1), _epacems_df("CO", 1)]
+    with pytest.raises(ValueError, match="already written"):
+        dfs_to_parquet(
+            dfs,
+            resource_id=RESOURCE_ID,
+            root_path=tmp_path,
+            partition_cols=PARTITION_COLS,
+        )
+
+
+def test_dfs_to_parquet_removes_partial_partition(tmp_path):
+    """A failure partway through a partition doesn't leave part of it behind."""
+
+    def dfs():
+        yield _epacems_df("CO", 2)
+        yield _epacems_df("ID", 1)
+        raise ValueError("Transform failed")
+
+    with pytest.raises(ValueError, match="Transform failed"):
+        dfs_to_parquet(
+            dfs(),
+            resource_id=RESOURCE_ID,
+            root_path=tmp_path,
+            partition_cols=PARTITION_COLS,
+        )
+    files = sorted(
+        p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.parquet")
+    )
+    assert files == ["year=2020/state=CO/2020-CO.parquet"]
+    dataset = ds.dataset(tmp_path, format="parquet", partitioning="hive")
+    assert dataset.count_rows() == 2
@@ -1,8 +1,11 @@
 """Tests for metadata not covered elsewhere."""
+import numpy as np
+import pandas as pd
 import pytest
 
 from pudl.metadata import RESOURCE_METADATA, Package
 from pudl.metadata.classes import DataSource
+from pudl.metadata.fields import apply_pudl_dtypes
 from pudl.metadata.helpers import format_errors
 from pudl.metadata.sources import SOURCES
 
@@ -33,3 +36,25 @@ def test_all_excluded_resources_exist() -> None:
                 *errors, title="Invalid resources in foreign_key_rules.exclude"
             )
         )
+
+
+def test_apply_pudl_dtypes_precomputed_without_copy() -> None:
+    """Precomputed dtypes are applied, and matching columns are left untouched."""
+    df = pd.DataFrame(
+        {
+            "plant_id_eia": np.array([1, 2], dtype="int64"),
+            "gross_load_mw": np.array([1.0, 2.0], dtype="float32"),
+            "other": ["a", "b"],
+        }
+    )
+    out = apply_pudl_dtypes(
+        df,
+        dtypes={"plant_id_eia": "Int32", "gross_load_mw": "float32"},
+        copy=False,
+    )
+    assert out.dtypes.to_dict() == {
+        "plant_id_eia": pd.Int32Dtype(),
+        "gross_load_mw": np.dtype("float32"),
+        "other": np.dtype("O"),
+    }
+    assert np.shares_memory(out["gross_load_mw"].values, df["gross_load_mw"].values)
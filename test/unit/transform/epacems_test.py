@@ -0,0 +1,50 @@
+"""Unit tests for the pudl.transform.epacems module."""
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+
+import pudl.transform.epacems as epacems
+
+
+def _raw_epacems_df() -> pd.DataFrame:
+    """A raw month of EPA CEMS data, with the dtypes extraction produces."""
+    return pd.DataFrame(
+        {
+            "state": pd.Categorical(["CO", "CO", "ID"]),
+            "plant_id_eia": pd.array([3, 3, 7], dtype="Int32"),
+            "unitid": pd.array(["1", "1", "2"], dtype="string"),
+            "op_date": ["01-01-2020", "01-01-2020", "01-02-2020"],
+            "op_hour": [0, 1, 23],
+            "operating_time_hours": np.array([1.0, 1.0, 0.5], dtype="float32"),
+            "gross_load_mw": np.array([100.0, np.nan, 50.0], dtype="float32"),
+            "heat_content_mmbtu": np.array([10.0, 20.0, np.nan], dtype="float32"),
+            "year": 2020,
+        }
+    )
+
+
+def test_transform__compact_dtypes_and_utc_offsets():
+    """Int32 plant IDs still match every plant's int64 ID in the PUDL DB."""
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame(
+        {"plant_id_eia": [3, 7], "timezone": ["America/Denver", "America/Boise"]}
+    ).to_sql("plants_entity_eia", engine, index=False)
+
+    (df,) = list(epacems.transform([_raw_epacems_df()], pudl_engine=engine))
+
+    # Mountain Standard Time is UTC-7 for both plants.
+    assert df["operating_datetime_utc"].tolist() == [
+        pd.Timestamp("2020-01-01 07:00"),
+        pd.Timestamp("2020-01-01 08:00"),
+        pd.Timestamp("2020-01-03 06:00"),
+    ]
+    expected = {
+        "plant_id_eia": pd.Int32Dtype(),
+        "facility_id": pd.Int32Dtype(),
+        "year": pd.Int32Dtype(),
+        "operating_time_hours": np.dtype("float32"),
+        "gross_load_mw": np.dtype("float32"),
+        "heat_content_mmbtu": np.dtype("float32"),
+    }
+    assert {col: df[col].dtype for col in expected} == expected
+    assert df["gross_load_mw"].tolist() == [100.0, 0.0, 50.0]